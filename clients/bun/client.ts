@@ -6,7 +6,7 @@
  * frame retrieval, IMU data analysis, and more.
  */
 
-import { readFile, writeFile, exists, stat } from 'fs/promises';
+import { readFile, writeFile, exists, stat, open } from 'fs/promises';
 import { join } from 'path';
 import { spawn } from 'bun';
 
@@ -15,6 +15,7 @@ export interface DepthAIStats {
   uptime_formatted: string;
   total_frames: number;
   error_count: number;
+  dropped_messages?: number;
   current_fps: number;
   average_fps: number;
   imu_data_count: number;
@@ -241,31 +242,34 @@ export class DepthAIClient {
         return [];
       }
 
-      const files = await Array.fromAsync(
-        new Bun.Glob('imu_*.json').scan({ cwd: imuDir })
-      );
-
-      // Get latest files
-      const fileStats = await Promise.all(
-        files.map(async (file) => {
-          const fullPath = join(imuDir, file);
-          const fileStat = await stat(fullPath);
-          return { file: fullPath, mtime: fileStat.mtime };
-        })
-      );
+      const imuData: IMUData[] = [];
 
-      const latestFiles = fileStats
-        .sort((a, b) => (b.mtime?.getTime() || 0) - (a.mtime?.getTime() || 0))
-        .slice(0, count);
+      // Hourly NDJSON logs written by the daemon, newest samples first
+      for (const file of await this.latestFiles(imuDir, 'imu_*.jsonl', count)) {
+        try {
+          // Only the end of the log is read; one extra line in case the last is still buffered
+          const lines = await this.readTail(file, count - imuData.length + 1);
+          for (let i = lines.length - 1; i >= 0 && imuData.length < count; i--) {
+            if (!lines[i]) continue;
+            try {
+              imuData.push(JSON.parse(lines[i]) as IMUData);
+            } catch {
+              // Last line may still be in the daemon's write buffer
+            }
+          }
+        } catch (error) {
+          console.warn(`Error reading IMU log ${file}:`, error);
+        }
+        if (imuData.length >= count) return imuData;
+      }
 
-      // Read and parse IMU data
-      const imuData: IMUData[] = [];
-      for (const fileInfo of latestFiles) {
+      // Legacy one-sample-per-file output
+      for (const file of await this.latestFiles(imuDir, 'imu_*.json', count - imuData.length)) {
         try {
-          const data = await readFile(fileInfo.file, 'utf-8');
+          const data = await readFile(file, 'utf-8');
           imuData.push(JSON.parse(data) as IMUData);
         } catch (error) {
-          console.warn(`Error reading IMU file ${fileInfo.file}:`, error);
+          console.warn(`Error reading IMU file ${file}:`, error);
         }
       }
 
@@ -276,6 +280,59 @@ export class DepthAIClient {
     }
   }
 
+  /**
+   * Get the last lines of a file by reading a growing window from its end
+   */
+  private async readTail(path: string, lines: number): Promise<string[]> {
+    const handle = await open(path, 'r');
+    try {
+      const { size } = await handle.stat();
+      let chunk = Math.min(size, 64 * 1024);
+      let data = Buffer.alloc(0);
+
+      // Read from the end, doubling the window until it holds enough lines
+      while (true) {
+        data = Buffer.alloc(chunk);
+        await handle.read(data, 0, chunk, size - chunk);
+
+        let newlines = 0;
+        for (let i = data.indexOf(10); i !== -1 && newlines <= lines; i = data.indexOf(10, i + 1)) {
+          newlines++;
+        }
+        if (chunk === size || newlines > lines) break;
+        chunk = Math.min(size, chunk * 2);
+      }
+
+      if (chunk < size) {
+        data = data.subarray(data.indexOf(10) + 1); // First line of the window may be partial
+      }
+
+      return data.toString('utf-8').trim().split('\n').slice(-lines);
+    } finally {
+      await handle.close();
+    }
+  }
+
+  /**
+   * Get the newest files in a directory matching a glob, by modification time
+   */
+  private async latestFiles(dir: string, pattern: string, count: number): Promise<string[]> {
+    const files = await Array.fromAsync(new Bun.Glob(pattern).scan({ cwd: dir }));
+
+    const fileStats = await Promise.all(
+      files.map(async (file) => {
+        const fullPath = join(dir, file);
+        const fileStat = await stat(fullPath);
+        return { file: fullPath, mtime: fileStat.mtime };
+      })
+    );
+
+    return fileStats
+      .sort((a, b) => (b.mtime?.getTime() || 0) - (a.mtime?.getTime() || 0))
+      .slice(0, count)
+      .map((item) => item.file);
+  }
+
   /**
    * Analyze IMU data for statistics
    */
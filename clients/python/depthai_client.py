@@ -9,17 +9,24 @@ Supports status monitoring, frame retrieval, IMU data analysis, and configuratio
 import json
 import os
 import time
-import glob
+import heapq
+import mmap
+import re
+import stat
 import subprocess
 import argparse
+import copy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Generator
 import threading
 
+import numpy as np
+
 try:
     import cv2
-    import numpy as np
     CV2_AVAILABLE = True
 except ImportError:
     CV2_AVAILABLE = False
@@ -33,6 +40,51 @@ except ImportError:
     MATPLOTLIB_AVAILABLE = False
     print("Warning: Matplotlib not available. Plotting features disabled.")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# How long a status read is reused before the file is checked again (seconds)
+STATUS_CACHE_TTL = 0.1
+
+# "status" values in status.json: the service status and the health status
+STATUS_VALUE_RE = re.compile(rb'"status"\s*:\s*"([^"]*)"')
+
+# Initial and maximum window read from the end of the log by get_logs (bytes)
+LOG_TAIL_CHUNK = 64 * 1024
+LOG_TAIL_MAX = 8 * 1024 * 1024
+
+# Files at least this large are memory-mapped instead of read into a buffer (bytes)
+MMAP_THRESHOLD = 4096
+
+# Maximum threads used to read IMU files concurrently
+IMU_READ_WORKERS = 16
+
+# Fields plucked from each IMU sample, in the order returned by _extract_imu_fields
+IMU_FIELDS = (
+    'timestamp',
+    'accelerometer.x', 'accelerometer.y', 'accelerometer.z',
+    'gyroscope.x', 'gyroscope.y', 'gyroscope.z',
+    'magnetometer.x', 'magnetometer.y', 'magnetometer.z',
+)
+IMU_FIELD_INDEX = {name: i for i, name in enumerate(IMU_FIELDS)}
+# Sensor name and offset of its x axis within an IMU_FIELDS row
+IMU_SENSORS = (('accelerometer', 1), ('gyroscope', 4), ('magnetometer', 7))
+
 class DepthAIClient:
     """Python client for DepthAI daemon service"""
     
@@ -42,28 +94,39 @@ class DepthAIClient:
         self.output_dir = '/tmp/depthai-frames'
         self.log_path = '/var/log/depthai-daemon/daemon.log'
         
-    def get_status(self) -> Optional[Dict[str, Any]]:
-        """Get current daemon status"""
+        # path -> ((st_mtime_ns, st_size), parsed JSON) for _load_json_cached
+        self._json_cache = {}
+        # (monotonic time of the last status read, status)
+        self._status_cache = (0.0, None)
+        # ((second, scale), rendered strip) for the stream timestamp overlay
+        self._ts_cache = (None, None)
+        
+    def get_status(self, force: bool = False) -> Optional[Dict[str, Any]]:
+        """Get current daemon status (force bypasses the short-lived cache)"""
+        now = time.monotonic()
+        read_at, status = self._status_cache
+        if not force and status is not None and now - read_at < STATUS_CACHE_TTL:
+            return status
+        
         try:
-            if not os.path.exists(self.status_path):
-                print("Warning: Status file not found. Is the daemon running?")
-                return None
-                
-            with open(self.status_path, 'r') as f:
-                return json.load(f)
+            status = self._load_json_cached(self.status_path)
+        except FileNotFoundError:
+            print("Warning: Status file not found. Is the daemon running?")
+            return None
         except Exception as e:
             print(f"Error reading status: {e}")
             return None
+        
+        self._status_cache = (now, status)
+        return status
     
     def get_config(self) -> Optional[Dict[str, Any]]:
         """Get current daemon configuration"""
         try:
-            if not os.path.exists(self.config_path):
-                print("Warning: Config file not found.")
-                return None
-                
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            return self._load_json_cached(self.config_path)
+        except FileNotFoundError:
+            print("Warning: Config file not found.")
+            return None
         except Exception as e:
             print(f"Error reading config: {e}")
             return None
@@ -79,8 +142,8 @@ class DepthAIClient:
             # Deep merge configuration
             new_config = self._deep_merge(current_config, config_updates)
             
-            with open(self.config_path, 'w') as f:
-                json.dump(new_config, f, indent=2)
+            self._write_file_atomic(self.config_path, self._dump_json(new_config))
+            self._json_cache.pop(self.config_path, None)
             
             print("Configuration updated. Reload daemon with: sudo systemctl kill -s HUP depthai-daemon")
             return True
@@ -95,14 +158,8 @@ class DepthAIClient:
                 print("Warning: Output directory not found. Frame saving may be disabled.")
                 return []
             
-            # Look for frames of specified type
-            pattern = os.path.join(self.output_dir, f"{frame_type}_*.jpg")
-            files = glob.glob(pattern)
-            
-            # Sort by modification time (newest first)
-            files.sort(key=os.path.getmtime, reverse=True)
-            
-            return files[:count]
+            # Look for frames of specified type (newest first)
+            return self._scan_sorted(self.output_dir, f"{frame_type}_", ".jpg", count)
         except Exception as e:
             print(f"Error getting latest frames: {e}")
             return []
@@ -110,81 +167,182 @@ class DepthAIClient:
     def get_latest_imu_data(self, count: int = 10) -> List[Dict[str, Any]]:
         """Get latest IMU data"""
         try:
-            imu_dir = os.path.join(self.output_dir, 'imu')
-            
-            if not os.path.exists(imu_dir):
-                print("Warning: IMU directory not found. IMU may be disabled or not available.")
-                return []
-            
-            # Get IMU JSON files
-            files = glob.glob(os.path.join(imu_dir, 'imu_*.json'))
-            files.sort(key=os.path.getmtime, reverse=True)
-            
-            imu_data = []
-            for file_path in files[:count]:
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        imu_data.append(data)
-                except Exception as e:
-                    print(f"Warning: Error reading IMU file {file_path}: {e}")
-            
-            return imu_data
+            return self._latest_imu_samples(count, self._load_json_file)
         except Exception as e:
             print(f"Error getting IMU data: {e}")
             return []
     
+    def _latest_imu_samples(self, count: int, file_reader, convert=None) -> List[Any]:
+        """Get the latest IMU samples (newest first) from the daemon's hourly NDJSON logs,
+        topped up from legacy one-sample-per-file imu_*.json files read with file_reader"""
+        imu_dir = os.path.join(self.output_dir, 'imu')
+        
+        if not os.path.exists(imu_dir):
+            print("Warning: IMU directory not found. IMU may be disabled or not available.")
+            return []
+        
+        samples = []
+        for path in self._scan_sorted(imu_dir, 'imu_', '.jsonl', count):
+            records = self._tail_imu_log(path, count - len(samples))
+            samples.extend(map(convert, records) if convert else records)
+            if len(samples) >= count:
+                return samples
+        
+        legacy = self._scan_sorted(imu_dir, 'imu_', '.json', count - len(samples))
+        samples.extend(self._read_imu_files(legacy, file_reader))
+        return samples
+    
+    @staticmethod
+    def _tail_imu_log(path: str, count: int) -> List[Dict[str, Any]]:
+        """Parse the last count samples of an NDJSON IMU log, newest first"""
+        # One extra line in case the last one is still in the daemon's write buffer
+        lines = DepthAIClient._read_tail(path, count + 1)
+        
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        records = []
+        for line in reversed(lines):
+            if not line:
+                continue
+            try:
+                records.append(loads(line))
+            except ValueError:
+                continue  # Last line may still be in the daemon's write buffer
+            if len(records) == count:
+                break
+        return records
+    
+    def _read_imu_files(self, paths: List[str], reader) -> List[Any]:
+        """Read IMU files on a thread pool to overlap per-file I/O, keeping order and skipping failures"""
+        def read_one(file_path):
+            try:
+                return reader(file_path)
+            except Exception as e:
+                print(f"Warning: Error reading IMU file {file_path}: {e}")
+                return None
+        
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(IMU_READ_WORKERS, len(paths))) as executor:
+                results = list(executor.map(read_one, paths))
+        else:
+            results = [read_one(file_path) for file_path in paths]
+        
+        return [result for result in results if result is not None]
+    
+    def _extract_imu_fields(self, path: str) -> tuple:
+        """Extract only the IMU_FIELDS values from an IMU file (None when missing)"""
+        fields = [None] * len(IMU_FIELDS)
+        
+        if IJSON_AVAILABLE:
+            # Stream the file and keep only the scalars we care about
+            with open(path, 'rb') as f:
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    index = IMU_FIELD_INDEX.get(prefix)
+                    if index is not None and event in ('number', 'string'):
+                        fields[index] = value
+            return tuple(fields)
+        
+        return self._imu_fields(self._load_json_file(path))
+    
+    @staticmethod
+    def _imu_fields(data: Dict[str, Any]) -> tuple:
+        """Pick the IMU_FIELDS values out of a parsed IMU sample (None when missing)"""
+        fields = [None] * len(IMU_FIELDS)
+        fields[0] = data.get('timestamp')
+        for index, name in enumerate(IMU_FIELDS[1:], start=1):
+            sensor, axis = name.split('.')
+            if sensor in data:
+                fields[index] = data[sensor].get(axis, 0)
+        return tuple(fields)
+    
     def monitor_status(self, interval: float = 1.0) -> Generator[Optional[Dict[str, Any]], None, None]:
         """Monitor daemon status in real-time"""
-        while True:
-            status = self.get_status()
-            yield status
-            time.sleep(interval)
+        # Watch the directory rather than the file so atomic replaces are seen too
+        inotify = self._watch_directory(os.path.dirname(self.status_path))
+        status_name = os.path.basename(self.status_path)
+        
+        try:
+            while True:
+                status = self.get_status(force=True)
+                yield status
+                
+                if inotify is None:
+                    time.sleep(interval)
+                    continue
+                
+                # Wake early when the daemon rewrites the status file, otherwise after interval
+                deadline = time.monotonic() + interval
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    events = inotify.read(timeout=int(remaining * 1000))
+                    if any(event.name == status_name for event in events):
+                        break
+        finally:
+            if inotify is not None:
+                inotify.close()
     
     def get_logs(self, lines: int = 50) -> List[str]:
         """Get recent log entries"""
         try:
-            if not os.path.exists(self.log_path):
-                print("Warning: Log file not found.")
+            if lines <= 0:
                 return []
             
-            # Use tail command to get last N lines
-            result = subprocess.run(['tail', '-n', str(lines), self.log_path], 
-                                  capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')
-            else:
-                print(f"Error reading logs: {result.stderr}")
-                return []
+            tail = self._read_tail(self.log_path, lines, LOG_TAIL_MAX)
+            if tail is None:
+                return self._tail_logs(lines)
+            return [line.decode('utf-8', errors='replace') for line in tail]
+        except FileNotFoundError:
+            print("Warning: Log file not found.")
+            return []
         except Exception as e:
             print(f"Error reading logs: {e}")
             return []
     
-    def is_healthy(self) -> bool:
-        """Check if daemon is healthy"""
+    def _tail_logs(self, lines: int) -> List[str]:
+        """Get the last lines of the log with tail (for logs with very long lines)"""
+        result = subprocess.run(['tail', '-n', str(lines), self.log_path], 
+                              capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            return result.stdout.strip().split('\n')
+        else:
+            print(f"Error reading logs: {result.stderr}")
+            return []
+    
+    def is_healthy(self, status: Optional[Dict[str, Any]] = None) -> bool:
+        """Check if daemon is healthy (from an already loaded status when given)"""
+        if status is not None:
+            return (status.get('health', {}).get('status') == 'healthy' and 
+                    status.get('status') == 'running')
+        
+        try:
+            raw = self._status_bytes()
+        except OSError:
+            raw = None
+        
+        if raw is not None:
+            # Fast path: scan for the two "status" values instead of parsing the whole file
+            values = STATUS_VALUE_RE.findall(raw)
+            if len(values) == 2:
+                return sorted(values) == [b'healthy', b'running']
+        
+        # Ambiguous or unreadable, fall back to a full parse
         status = self.get_status()
         return (status and 
                 status.get('health', {}).get('status') == 'healthy' and 
                 status.get('status') == 'running')
     
+    def _status_bytes(self) -> bytes:
+        """Get the raw contents of the status file"""
+        return Path(self.status_path).read_bytes()
+    
     def export_data(self, output_path: str) -> bool:
         """Export comprehensive data to JSON file"""
         try:
-            export_data = {
-                'timestamp': datetime.now().isoformat(),
-                'status': self.get_status(),
-                'config': self.get_config(),
-                'recent_imu_data': self.get_latest_imu_data(100),
-                'recent_logs': self.get_logs(100),
-                'latest_frames': {
-                    'rgb': self.get_latest_frames(10, 'rgb'),
-                    'depth': self.get_latest_frames(10, 'depth')
-                }
-            }
+            export_data = self._build_export_record()
             
-            with open(output_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            self._write_file_atomic(output_path, self._dump_json(export_data))
             
             print(f"Data exported to: {output_path}")
             return True
@@ -192,67 +350,125 @@ class DepthAIClient:
             print(f"Error exporting data: {e}")
             return False
     
+    def export_jsonl(self, output_path: str) -> bool:
+        """Append a snapshot of comprehensive data as one line to a JSONL file"""
+        try:
+            record = self._build_export_record()
+            if ORJSON_AVAILABLE:
+                line = orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+            else:
+                line = (json.dumps(record, separators=(',', ':')) + '\n').encode()
+            
+            # O_APPEND keeps each record a single append, previous snapshots are never rewritten
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+            
+            print(f"Snapshot appended to: {output_path}")
+            return True
+        except Exception as e:
+            print(f"Error exporting data: {e}")
+            return False
+    
+    def _build_export_record(self) -> Dict[str, Any]:
+        """Collect status, config, recent IMU data, logs and frames for export"""
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'status': self.get_status(),
+            'config': self.get_config(),
+            'recent_imu_data': self.get_latest_imu_data(100),
+            'recent_logs': self.get_logs(100),
+            'latest_frames': {
+                'rgb': self.get_latest_frames(10, 'rgb'),
+                'depth': self.get_latest_frames(10, 'depth')
+            }
+        }
+    
     def analyze_imu_data(self, samples: int = 100) -> Dict[str, Any]:
         """Analyze recent IMU data for statistics"""
         if not MATPLOTLIB_AVAILABLE:
             print("Matplotlib not available for IMU analysis")
             return {}
         
-        imu_data = self.get_latest_imu_data(samples)
-        if not imu_data:
+        series = self._collect_imu_series(samples)
+        if not series:
             return {}
         
-        analysis = {
-            'sample_count': len(imu_data),
-            'accelerometer': {'x': [], 'y': [], 'z': []},
-            'gyroscope': {'x': [], 'y': [], 'z': []},
-            'magnetometer': {'x': [], 'y': [], 'z': []},
-            'timestamps': []
-        }
-        
-        for data in imu_data:
-            analysis['timestamps'].append(data.get('timestamp', ''))
-            
-            if 'accelerometer' in data:
-                acc = data['accelerometer']
-                analysis['accelerometer']['x'].append(acc.get('x', 0))
-                analysis['accelerometer']['y'].append(acc.get('y', 0))
-                analysis['accelerometer']['z'].append(acc.get('z', 0))
-            
-            if 'gyroscope' in data:
-                gyro = data['gyroscope']
-                analysis['gyroscope']['x'].append(gyro.get('x', 0))
-                analysis['gyroscope']['y'].append(gyro.get('y', 0))
-                analysis['gyroscope']['z'].append(gyro.get('z', 0))
-            
-            if 'magnetometer' in data:
-                mag = data['magnetometer']
-            if 'magnetometer' in data:
-                mag = data['magnetometer']
-                analysis['magnetometer']['x'].append(mag.get('x', 0))
-                analysis['magnetometer']['y'].append(mag.get('y', 0))
-                analysis['magnetometer']['z'].append(mag.get('z', 0))
+        analysis = {'sample_count': series['sample_count'], 'timestamps': series['timestamps']}
         
         # Calculate statistics
-        for sensor in ['accelerometer', 'gyroscope', 'magnetometer']:
-            if analysis[sensor]['x']:  # If we have data for this sensor
-                for axis in ['x', 'y', 'z']:
-                    values = analysis[sensor][axis]
-                    analysis[sensor][f'{axis}_mean'] = np.mean(values) if values else 0
-                    analysis[sensor][f'{axis}_std'] = np.std(values) if values else 0
-                    analysis[sensor][f'{axis}_min'] = np.min(values) if values else 0
-                    analysis[sensor][f'{axis}_max'] = np.max(values) if values else 0
+        for sensor, _ in IMU_SENSORS:
+            values = series[sensor]
+            # Plain lists, as before, so the result stays JSON-serializable and owns its data
+            result = {'x': values[:, 0].tolist(), 'y': values[:, 1].tolist(), 'z': values[:, 2].tolist()}
+            if len(values):  # If we have data for this sensor
+                stats = {'mean': values.mean(axis=0), 'std': values.std(axis=0),
+                         'min': values.min(axis=0), 'max': values.max(axis=0)}
+                for i, axis in enumerate(['x', 'y', 'z']):
+                    for name, column in stats.items():
+                        result[f'{axis}_{name}'] = float(column[i])
+            analysis[sensor] = result
         
         return analysis
     
-    def display_frame(self, frame_path: str, window_name: str = "DepthAI Frame"):
-        """Display a frame using OpenCV"""
+    def _collect_imu_series(self, samples: int) -> Dict[str, Any]:
+        """Collect recent IMU samples as one (n, 3) array per sensor plus plot x values, without statistics"""
+        rows = self._latest_imu_samples(samples, self._extract_imu_fields, self._imu_fields)
+        if not rows:
+            return {}
+        
+        # One (n, 3) array per sensor plus a mask of the rows that carried it
+        n = len(rows)
+        arrays = {sensor: (np.empty((n, 3), dtype=np.float64), np.zeros(n, dtype=bool))
+                  for sensor, _ in IMU_SENSORS}
+        timestamps = []
+        times = np.empty(n, dtype='datetime64[us]')
+        
+        for i, row in enumerate(rows):
+            timestamps.append(row[0] or '')
+            times[i] = self._parse_imu_timestamp(row[0])
+            
+            for sensor, offset in IMU_SENSORS:
+                values = row[offset:offset + 3]
+                if any(v is not None for v in values):
+                    data, valid = arrays[sensor]
+                    data[i] = [v or 0 for v in values]
+                    valid[i] = True
+        
+        # Plot against the sample times when they all parse, otherwise against sample number
+        has_times = not np.isnat(times).any()
+        x_values = times if has_times else np.arange(n)
+        
+        series = {'sample_count': n, 'timestamps': timestamps, 'has_times': has_times, 'x': {}}
+        for sensor, (data, valid) in arrays.items():
+            if valid.all():
+                series[sensor], series['x'][sensor] = data, x_values
+            else:
+                series[sensor], series['x'][sensor] = data[valid], x_values[valid]
+        
+        return series
+    
+    @staticmethod
+    def _parse_imu_timestamp(value: Any) -> np.datetime64:
+        """Parse an IMU timestamp (daemon YYYYmmdd_HHMMSS_ffffff or ISO 8601), NaT if invalid"""
+        if isinstance(value, str) and len(value) == 22 and value[8] == '_' and value[15] == '_':
+            value = (f"{value[0:4]}-{value[4:6]}-{value[6:8]}T"
+                     f"{value[9:11]}:{value[11:13]}:{value[13:15]}.{value[16:22]}")
+        try:
+            return np.datetime64(value or 'NaT', 'us')
+        except (TypeError, ValueError):
+            return np.datetime64('NaT')
+    
+    def display_frame(self, frame_path: str, window_name: str = "DepthAI Frame", scale: int = 1):
+        """Display a frame using OpenCV (scale 2, 4 or 8 decodes a downscaled preview)"""
         if not CV2_AVAILABLE:
             print("OpenCV not available for frame display")
             return
         
         try:
-            frame = cv2.imread(frame_path)
+            frame = self._read_frame(frame_path, scale)
             if frame is None:
                 print(f"Could not load frame: {frame_path}")
                 return
@@ -269,48 +485,45 @@ class DepthAIClient:
             print("Matplotlib not available for plotting")
             return
         
-        analysis = self.analyze_imu_data(samples)
-        if not analysis or not analysis['timestamps']:
+        series = self._collect_imu_series(samples)
+        if not series or not series['timestamps']:
             print("No IMU data available for plotting")
             return
         
         fig, axes = plt.subplots(3, 1, figsize=(12, 10))
         fig.suptitle('DepthAI IMU Data Analysis')
         
-        # Convert timestamps to relative time
-        timestamps = range(len(analysis['timestamps']))
-        
         # Plot accelerometer
-        if analysis['accelerometer']['x']:
-            axes[0].plot(timestamps, analysis['accelerometer']['x'], 'r-', label='X')
-            axes[0].plot(timestamps, analysis['accelerometer']['y'], 'g-', label='Y')
-            axes[0].plot(timestamps, analysis['accelerometer']['z'], 'b-', label='Z')
+        if len(series['accelerometer']):
+            axes[0].plot(series['x']['accelerometer'], series['accelerometer'][:, 0], 'r-', label='X')
+            axes[0].plot(series['x']['accelerometer'], series['accelerometer'][:, 1], 'g-', label='Y')
+            axes[0].plot(series['x']['accelerometer'], series['accelerometer'][:, 2], 'b-', label='Z')
             axes[0].set_title('Accelerometer (m/s²)')
             axes[0].set_ylabel('Acceleration')
             axes[0].legend()
             axes[0].grid(True)
         
         # Plot gyroscope
-        if analysis['gyroscope']['x']:
-            axes[1].plot(timestamps, analysis['gyroscope']['x'], 'r-', label='X')
-            axes[1].plot(timestamps, analysis['gyroscope']['y'], 'g-', label='Y')
-            axes[1].plot(timestamps, analysis['gyroscope']['z'], 'b-', label='Z')
+        if len(series['gyroscope']):
+            axes[1].plot(series['x']['gyroscope'], series['gyroscope'][:, 0], 'r-', label='X')
+            axes[1].plot(series['x']['gyroscope'], series['gyroscope'][:, 1], 'g-', label='Y')
+            axes[1].plot(series['x']['gyroscope'], series['gyroscope'][:, 2], 'b-', label='Z')
             axes[1].set_title('Gyroscope (rad/s)')
             axes[1].set_ylabel('Angular Velocity')
             axes[1].legend()
             axes[1].grid(True)
         
         # Plot magnetometer
-        if analysis['magnetometer']['x']:
-            axes[2].plot(timestamps, analysis['magnetometer']['x'], 'r-', label='X')
-            axes[2].plot(timestamps, analysis['magnetometer']['y'], 'g-', label='Y')
-            axes[2].plot(timestamps, analysis['magnetometer']['z'], 'b-', label='Z')
+        if len(series['magnetometer']):
+            axes[2].plot(series['x']['magnetometer'], series['magnetometer'][:, 0], 'r-', label='X')
+            axes[2].plot(series['x']['magnetometer'], series['magnetometer'][:, 1], 'g-', label='Y')
+            axes[2].plot(series['x']['magnetometer'], series['magnetometer'][:, 2], 'b-', label='Z')
             axes[2].set_title('Magnetometer (µT)')
             axes[2].set_ylabel('Magnetic Field')
             axes[2].legend()
             axes[2].grid(True)
         
-        axes[2].set_xlabel('Sample Number')
+        axes[2].set_xlabel('Time' if series['has_times'] else 'Sample Number')
         
         plt.tight_layout()
         
@@ -331,102 +544,304 @@ class DepthAIClient:
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         fig.suptitle('DepthAI Live Monitor')
         
-        # Data storage for live plotting
-        timestamps = []
-        fps_data = []
-        temp_data = []
-        frame_count_data = []
+        # Data storage for live plotting (keep only last 50 points)
+        timestamps = deque(maxlen=50)
+        fps_data = deque(maxlen=50)
+        temp_data = deque(maxlen=50)
+        frame_count_data = deque(maxlen=50)
+        
+        # Create the artists once and only update their data on each tick
+        line_fps, = ax1.plot([], [], 'g-')
+        ax1.set_title('Current FPS')
+        ax1.set_ylabel('FPS')
+        ax1.grid(True)
+        
+        line_temp, = ax2.plot([], [], 'r-')
+        ax2.set_title('Device Temperature')
+        ax2.set_ylabel('Temperature (°C)')
+        ax2.grid(True)
+        
+        line_frames, = ax3.plot([], [], 'b-')
+        ax3.set_title('Total Frames')
+        ax3.set_ylabel('Frame Count')
+        ax3.grid(True)
+        
+        # Status text
+        status_texts = [ax4.text(0.1, y, '', fontsize=12) for y in (0.8, 0.7, 0.6, 0.5, 0.4)]
+        ax4.set_xlim(0, 1)
+        ax4.set_ylim(0, 1)
+        ax4.set_title('System Status')
+        ax4.axis('off')
         
         def update_plots(frame):
             status = self.get_status()
             if not status:
                 return
             
+            stats = status['stats']
             current_time = time.time()
             timestamps.append(current_time)
-            fps_data.append(status['stats']['current_fps'])
-            temp_data.append(status['stats'].get('current_temperature_c', 0))
-            frame_count_data.append(status['stats']['total_frames'])
-            
-            # Keep only last 50 points
-            if len(timestamps) > 50:
-                timestamps.pop(0)
-                fps_data.pop(0)
-                temp_data.pop(0)
-                frame_count_data.pop(0)
-            
-            # Clear and update plots
-            ax1.clear()
-            ax1.plot(timestamps, fps_data, 'g-')
-            ax1.set_title('Current FPS')
-            ax1.set_ylabel('FPS')
-            ax1.grid(True)
-            
-            ax2.clear()
-            ax2.plot(timestamps, temp_data, 'r-')
-            ax2.set_title('Device Temperature')
-            ax2.set_ylabel('Temperature (°C)')
-            ax2.grid(True)
+            fps_data.append(stats['current_fps'])
+            temp_data.append(stats.get('current_temperature_c', 0))
+            frame_count_data.append(stats['total_frames'])
             
-            ax3.clear()
-            ax3.plot(timestamps, frame_count_data, 'b-')
-            ax3.set_title('Total Frames')
-            ax3.set_ylabel('Frame Count')
-            ax3.grid(True)
+            for ax, line, data in ((ax1, line_fps, fps_data),
+                                   (ax2, line_temp, temp_data),
+                                   (ax3, line_frames, frame_count_data)):
+                line.set_data(timestamps, data)
+                ax.relim()
+                ax.autoscale_view()
             
-            # Status text
-            ax4.clear()
-            ax4.text(0.1, 0.8, f"Status: {status['status']}", fontsize=12)
-            ax4.text(0.1, 0.7, f"Health: {status['health']['status']}", fontsize=12)
-            ax4.text(0.1, 0.6, f"Uptime: {status['stats']['uptime_formatted']}", fontsize=12)
-            ax4.text(0.1, 0.5, f"Errors: {status['stats']['error_count']}", fontsize=12)
-            if status['stats'].get('imu_data_count', 0) > 0:
-                ax4.text(0.1, 0.4, f"IMU Samples: {status['stats']['imu_data_count']:,}", fontsize=12)
-            ax4.set_xlim(0, 1)
-            ax4.set_ylim(0, 1)
-            ax4.set_title('System Status')
-            ax4.axis('off')
+            status_texts[0].set_text(f"Status: {status['status']}")
+            status_texts[1].set_text(f"Health: {status['health']['status']}")
+            status_texts[2].set_text(f"Uptime: {stats['uptime_formatted']}")
+            status_texts[3].set_text(f"Errors: {stats['error_count']}")
+            imu_count = stats.get('imu_data_count', 0)
+            if imu_count > 0:
+                status_texts[4].set_text(f"IMU Samples: {imu_count:,}")
+            else:
+                status_texts[4].set_text('')
         
         ani = animation.FuncAnimation(fig, update_plots, interval=2000, blit=False)
         plt.tight_layout()
         plt.show()
     
-    def stream_frames(self, frame_type: str = "rgb", display_time: float = 0.1):
-        """Stream frames in real-time"""
+    def stream_frames(self, frame_type: str = "rgb", display_time: float = 0.1, scale: int = 2):
+        """Stream frames in real-time (decoded at 1/scale resolution)"""
         if not CV2_AVAILABLE:
             print("OpenCV not available for frame streaming")
             return
         
         print(f"Streaming {frame_type} frames. Press 'q' to quit.")
         
-        last_frame = None
-        while True:
-            frames = self.get_latest_frames(1, frame_type)
-            if frames and frames[0] != last_frame:
-                last_frame = frames[0]
-                frame = cv2.imread(frames[0])
-                if frame is not None:
-                    # Add timestamp overlay
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    cv2.putText(frame, timestamp, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 
-                              1, (255, 255, 255), 2)
-                    
-                    cv2.imshow(f"DepthAI {frame_type.upper()} Stream", frame)
-            
-            if cv2.waitKey(int(display_time * 1000)) & 0xFF == ord('q'):
-                break
+        window_name = f"DepthAI {frame_type.upper()} Stream"
+        prefix = f"{frame_type}_"
+        inotify = self._watch_directory(self.output_dir)
+        
+        frames = self.get_latest_frames(1, frame_type)
+        last_frame = frames[0] if frames else None
+        if last_frame:
+            self._show_stream_frame(last_frame, window_name, scale)
+        
+        try:
+            while True:
+                if inotify is not None:
+                    # Block until the daemon finishes writing a new frame
+                    names = [event.name for event in inotify.read(timeout=int(display_time * 1000))
+                             if event.name.startswith(prefix) and event.name.endswith('.jpg')]
+                    frame_path = os.path.join(self.output_dir, names[-1]) if names else None
+                    wait_ms = 1
+                else:
+                    frames = self.get_latest_frames(1, frame_type)
+                    frame_path = frames[0] if frames else None
+                    wait_ms = int(display_time * 1000)
+                
+                if frame_path and frame_path != last_frame:
+                    last_frame = frame_path
+                    self._show_stream_frame(frame_path, window_name, scale)
+                
+                if cv2.waitKey(wait_ms) & 0xFF == ord('q'):
+                    break
+        finally:
+            if inotify is not None:
+                inotify.close()
         
         cv2.destroyAllWindows()
     
+    def _show_stream_frame(self, frame_path: str, window_name: str, scale: int = 1):
+        """Load a frame, add the timestamp overlay and show it"""
+        try:
+            frame = self._read_frame(frame_path, scale)
+        except OSError:
+            return  # Frame was removed before we got to it
+        if frame is not None:
+            # Add timestamp overlay (white text, so a per-pixel max keeps the image behind it)
+            overlay = self._timestamp_overlay(scale)
+            height = min(overlay.shape[0], frame.shape[0])
+            width = min(overlay.shape[1], frame.shape[1])
+            region = frame[:height, :width]
+            np.maximum(region, overlay[:height, :width], out=region)
+            
+            cv2.imshow(window_name, frame)
+    
+    def _timestamp_overlay(self, scale: int = 1) -> np.ndarray:
+        """Get the rendered timestamp strip for frames reduced by scale,
+        re-rendering it only when the second (or scale) changes"""
+        now = int(time.time())
+        if self._ts_cache[0] != (now, scale):
+            timestamp = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+            
+            # Shrink the text with the frame so the whole timestamp fits reduced frames too
+            font_scale = 1.0 / scale
+            thickness = max(1, round(2 / scale))
+            x, y = max(1, 10 // scale), max(1, 30 // scale)
+            
+            # Wide enough for the whole text: x offset + text width + stroke thickness
+            (text_width, _), baseline = cv2.getTextSize(timestamp, cv2.FONT_HERSHEY_SIMPLEX,
+                                                        font_scale, thickness)
+            height = max(40 // scale, y + baseline + thickness)
+            overlay = np.zeros((height, x + text_width + thickness, 3), dtype=np.uint8)
+            cv2.putText(overlay, timestamp, (x, y), cv2.FONT_HERSHEY_SIMPLEX, 
+                      font_scale, (255, 255, 255), thickness)
+            self._ts_cache = ((now, scale), overlay)
+        
+        return self._ts_cache[1]
+    
+    @staticmethod
+    def _watch_directory(directory: str) -> Optional['INotify']:
+        """Watch a directory for completed writes and renames (None if inotify is unavailable)"""
+        if not INOTIFY_AVAILABLE:
+            return None
+        
+        inotify = None
+        try:
+            inotify = INotify()
+            inotify.add_watch(directory, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+            return inotify
+        except OSError:
+            if inotify is not None:
+                inotify.close()
+            return None
+    
+    @staticmethod
+    def _read_tail(path: str, lines: int, max_chunk: Optional[int] = None) -> Optional[List[bytes]]:
+        """Get the last lines of a file by reading from its end (None if they need more than max_chunk bytes)"""
+        with open(path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            chunk = min(size, LOG_TAIL_CHUNK)
+            
+            # Read from the end, doubling the window until it holds enough lines
+            while True:
+                f.seek(size - chunk)
+                data = f.read(chunk)
+                if chunk == size or data.count(b'\n') > lines:
+                    break
+                if max_chunk is not None and chunk >= max_chunk:
+                    return None
+                chunk = min(size, chunk * 2)
+        
+        if chunk < size:
+            data = data[data.index(b'\n') + 1:]  # First line of the window may be partial
+        
+        return data.strip().split(b'\n')[-lines:]
+    
+    @staticmethod
+    def _scan_sorted(directory: str, prefix: str, suffix: str, count: int) -> List[str]:
+        """Get paths of the newest files matching prefix/suffix in a single directory pass"""
+        with os.scandir(directory) as it:
+            entries = [e for e in it if e.name.startswith(prefix) and e.name.endswith(suffix)]
+        
+        # Partial selection of the newest count entries, no need to sort everything
+        newest = heapq.nlargest(count, entries, key=lambda e: e.stat().st_mtime)
+        return [e.path for e in newest]
+    
+    def _load_json_cached(self, path: str) -> Any:
+        """Load a JSON file, re-parsing it only when its mtime or size changed"""
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        data = self._load_json_file(path)
+        self._json_cache[path] = (key, data)
+        return data
+    
+    @staticmethod
+    def _load_json_file(path: str) -> Any:
+        """Read and parse a JSON file as raw bytes, memory-mapping larger files"""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if ORJSON_AVAILABLE and size >= MMAP_THRESHOLD:
+                # Parse straight from the page cache without copying into a buffer
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                    return orjson.loads(view)
+            buf = os.read(fd, size)
+        finally:
+            os.close(fd)
+        return orjson.loads(buf) if ORJSON_AVAILABLE else json.loads(buf)
+    
+    @staticmethod
+    def _read_frame(path: str, scale: int = 1) -> Optional[np.ndarray]:
+        """Read and decode an image file, memory-mapping larger files (None if unreadable)"""
+        # Reduced modes let libjpeg downscale during the IDCT instead of after decoding
+        reduced_flags = {
+            1: cv2.IMREAD_COLOR,
+            2: cv2.IMREAD_REDUCED_COLOR_2,
+            4: cv2.IMREAD_REDUCED_COLOR_4,
+            8: cv2.IMREAD_REDUCED_COLOR_8
+        }
+        if scale not in reduced_flags:
+            raise ValueError(f"Unsupported frame scale: {scale} (expected 1, 2, 4 or 8)")
+        flags = reduced_flags[scale]
+        
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return None
+            if size < MMAP_THRESHOLD:
+                return cv2.imdecode(np.frombuffer(f.read(), dtype=np.uint8), flags)
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = np.frombuffer(mapped, dtype=np.uint8)
+                frame = cv2.imdecode(data, flags)
+                del data  # Release the buffer export before the map is closed
+            return frame
+    
+    @staticmethod
+    def _dump_json(data: Any) -> bytes:
+        """Serialize data as indented JSON bytes"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        return (json.dumps(data, indent=2) + '\n').encode()
+    
+    @staticmethod
+    def _write_file_atomic(path: str, data: bytes):
+        """Write data in one write + fsync to a temp file, then rename it over path"""
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        
+        tmp_path = f"{path}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        except PermissionError:
+            # Directory is not writable for us (e.g. /etc/depthai-daemon), rewrite in place
+            tmp_path = None
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            if tmp_path:
+                os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    
     @staticmethod
     def _deep_merge(dict1: Dict, dict2: Dict) -> Dict:
         """Deep merge two dictionaries"""
-        result = dict1.copy()
-        for key, value in dict2.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = DepthAIClient._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        result = copy.deepcopy(dict1)
+        
+        # Merge nested dicts in place on the copy instead of copying every level
+        stack = [(result, dict2)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict) and isinstance(target.get(key), dict):
+                    stack.append((target[key], value))
+                else:
+                    target[key] = value
         return result
     
     @staticmethod
@@ -464,6 +879,9 @@ class DepthAICLI:
             return
         
         stats = status['stats']
+        health = status['health']
+        imu_count = stats.get('imu_data_count', 0)
+        temperature = stats.get('current_temperature_c')
         print(f"📊 Service Status: {'✅ Running' if status['status'] == 'running' else '❌ Stopped'}")
         print(f"🆔 Process ID: {status['pid']}")
         print(f"⏱️  Uptime: {self.client.format_uptime(stats['uptime_seconds'])}")
@@ -472,16 +890,17 @@ class DepthAICLI:
         print(f"📊 Average FPS: {stats['average_fps']:.1f}")
         print(f"❌ Errors: {stats['error_count']}")
         
-        if stats.get('imu_data_count', 0) > 0:
-            print(f"🧭 IMU Samples: {stats['imu_data_count']:,}")
+        if imu_count > 0:
+            print(f"🧭 IMU Samples: {imu_count:,}")
         
-        if stats.get('current_temperature_c'):
-            print(f"🌡️  Temperature: {stats['current_temperature_c']:.1f}°C")
+        if temperature:
+            print(f"🌡️  Temperature: {temperature:.1f}°C")
         
-        print(f"\n🏥 Health: {'✅ Healthy' if status['health']['status'] == 'healthy' else '⚠️ ' + status['health']['status']}")
-        if status['health']['issues']:
+        health_status = health['status']
+        print(f"\n🏥 Health: {'✅ Healthy' if health_status == 'healthy' else '⚠️ ' + health_status}")
+        if health['issues']:
             print("⚠️  Issues:")
-            for issue in status['health']['issues']:
+            for issue in health['issues']:
                 print(f"   • {issue}")
     
     def monitor_status(self):
@@ -499,15 +918,20 @@ class DepthAICLI:
                 print("🔄 Real-time DepthAI Monitor\n")
                 
                 stats = status['stats']
-                print(f"Status: {status['status']} | FPS: {stats['current_fps']:.1f} | Frames: {stats['total_frames']:,}")
+                health_status = status['health']['status']
+                current_fps = stats['current_fps']
+                total_frames = stats['total_frames']
+                temperature = stats.get('current_temperature_c')
+                imu_count = stats.get('imu_data_count', 0)
+                print(f"Status: {status['status']} | FPS: {current_fps:.1f} | Frames: {total_frames:,}")
                 
-                if stats.get('current_temperature_c'):
-                    print(f"Temperature: {stats['current_temperature_c']:.1f}°C")
+                if temperature:
+                    print(f"Temperature: {temperature:.1f}°C")
                 
-                if stats.get('imu_data_count', 0) > 0:
-                    print(f"IMU: {stats['imu_data_count']:,} samples")
+                if imu_count > 0:
+                    print(f"IMU: {imu_count:,} samples")
                 
-                print(f"Health: {status['health']['status']} | Uptime: {self.client.format_uptime(stats['uptime_seconds'])}")
+                print(f"Health: {health_status} | Uptime: {self.client.format_uptime(stats['uptime_seconds'])}")
                 print(f"Last update: {datetime.now().strftime('%H:%M:%S')}")
         
         except KeyboardInterrupt:
@@ -607,10 +1031,10 @@ class DepthAICLI:
         """Check daemon health"""
         print("🏥 Health Check\n")
         
-        is_healthy = self.client.is_healthy()
+        status = self.client.get_status()
+        is_healthy = status is not None and self.client.is_healthy(status)
         print(f"Status: {'✅ Healthy' if is_healthy else '❌ Unhealthy'}")
         
-        status = self.client.get_status()
         if status and status['health'].get('issues'):
             print("\n⚠️  Issues:")
             for issue in status['health']['issues']:
@@ -626,6 +1050,16 @@ class DepthAICLI:
         else:
             print("❌ Export failed")
     
+    def export_jsonl(self, output_path: str):
+        """Append a data snapshot to a JSONL file"""
+        print("💾 Appending DepthAI snapshot...")
+        
+        success = self.client.export_jsonl(output_path)
+        if success:
+            print("✅ Snapshot appended")
+        else:
+            print("❌ Export failed")
+    
     def set_fps(self, fps: int):
         """Set camera FPS"""
         print(f"🎬 Setting FPS to {fps}...")
@@ -651,6 +1085,7 @@ class DepthAICLI:
         print("  frames [count]      - List recent frames (default: 10)")
         print("  logs [lines]        - Show recent log lines (default: 20)")
         print("  export [file]       - Export all data to JSON")
+        print("  export-jsonl [file] - Append a data snapshot to a JSONL file")
         print("  health              - Check daemon health")
         print("  set-fps N           - Set camera FPS to N")
         print("  plot-imu [samples]  - Plot IMU data (requires matplotlib)")
@@ -688,6 +1123,9 @@ def main():
         elif args.command == 'export':
             output_path = args.args[0] if args.args else f'depthai-export-{int(time.time())}.json'
             cli.export_data(output_path)
+        elif args.command == 'export-jsonl':
+            output_path = args.args[0] if args.args else 'depthai-export.jsonl'
+            cli.export_jsonl(output_path)
         elif args.command == 'health':
             cli.check_health()
         elif args.command == 'set-fps':
@@ -6,7 +6,6 @@ health monitoring, multiple output modes, and robust error handling.
 """
 
 import depthai as dai
-import cv2
 import numpy as np
 import time
 import logging
@@ -14,13 +13,58 @@ import signal
 import sys
 import json
 import os
+import hashlib
 import threading
+import multiprocessing
+from multiprocessing import shared_memory
+from functools import partial
 import queue
-import socket
-from pathlib import Path
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional
 import argparse
+import atexit
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJPF_RGB, TJSAMP_420
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+# Quality of saved frames (cv2.imencode's default, kept whichever encoder is used)
+JPEG_QUALITY = 95
+
+def _json_bytes(obj: Dict[str, Any], indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, compact unless indent is requested"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+def _write_file_atomic(path: str, data: bytes):
+    """Write data to a temp file and rename it over path, so readers never see a partial file"""
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+def _json_line(obj: Dict[str, Any]) -> bytes:
+    """Serialize obj as one compact NDJSON line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return _json_bytes(obj) + b"\n"
 
 class DepthAIConfig:
     """Configuration management for DepthAI daemon"""
@@ -101,62 +145,110 @@ class DepthAIConfig:
 class DepthAIStats:
     """Statistics and monitoring for DepthAI daemon"""
     
+    FPS_HISTORY_SIZE = 30  # Keep last 30 samples
+    TEMPERATURE_HISTORY_SIZE = 60  # Keep last 60 readings
+    
     def __init__(self):
         self.start_time = time.time()
-        self.frame_count = 0
-        self.error_count = 0
         self.last_frame_time = 0
-        self.fps_history = []
-        self.imu_data_count = 0
-        self.temperature_history = []
+        self.fps_history = deque(maxlen=self.FPS_HISTORY_SIZE)
+        self.temperature_history = deque(maxlen=self.TEMPERATURE_HISTORY_SIZE)
+        # Running sums so get_stats() averages without re-summing the windows
+        self._fps_sum = 0.0
+        self._temp_sum = 0.0
         self.lock = threading.Lock()
+        
+        # Frame/IMU/error counters live per thread so producers never contend on a lock;
+        # get_stats() sums every thread's counters (threads only ever touch their own)
+        self._tls = threading.local()
+        self._counter_refs = []
+        self._registry_lock = threading.Lock()
+    
+    def _counters(self) -> Dict[str, int]:
+        """Get the calling thread's counters, registering them on first use"""
+        counters = getattr(self._tls, "counters", None)
+        if counters is None:
+            counters = {"frames": 0, "imu": 0, "errors": 0, "dropped": 0}
+            self._tls.counters = counters
+            with self._registry_lock:
+                self._counter_refs.append(counters)
+        return counters
+    
+    def _total(self, name: str) -> int:
+        """Sum a counter over all threads"""
+        with self._registry_lock:
+            return sum(counters[name] for counters in self._counter_refs)
+    
+    @property
+    def frame_count(self) -> int:
+        return self._total("frames")
+    
+    @property
+    def imu_data_count(self) -> int:
+        return self._total("imu")
+    
+    @property
+    def error_count(self) -> int:
+        return self._total("errors")
+    
+    @property
+    def dropped_count(self) -> int:
+        return self._total("dropped")
     
     def update_frame_stats(self):
         """Update frame statistics"""
+        self._counters()["frames"] += 1
+        
         with self.lock:
             current_time = time.time()
             if self.last_frame_time > 0:
                 fps = 1.0 / (current_time - self.last_frame_time)
+                if len(self.fps_history) == self.FPS_HISTORY_SIZE:
+                    self._fps_sum -= self.fps_history[0]
+                self._fps_sum += fps
                 self.fps_history.append(fps)
-                if len(self.fps_history) > 30:  # Keep last 30 samples
-                    self.fps_history.pop(0)
             
-            self.frame_count += 1
             self.last_frame_time = current_time
     
-    # Corrected method: removed duplicate definition
     def update_imu_stats(self):
         """Update IMU statistics"""
-        with self.lock:
-            self.imu_data_count += 1
+        self._counters()["imu"] += 1
     
     def increment_error(self):
         """Increment error counter"""
-        with self.lock:
-            self.error_count += 1
+        self._counters()["errors"] += 1
+    
+    def increment_dropped(self):
+        """Increment counter of device messages dropped before processing"""
+        self._counters()["dropped"] += 1
     
     def add_temperature_reading(self, temp_celsius):
         """Add temperature reading to history"""
         with self.lock:
+            if len(self.temperature_history) == self.TEMPERATURE_HISTORY_SIZE:
+                self._temp_sum -= self.temperature_history[0]
+            self._temp_sum += temp_celsius
             self.temperature_history.append(temp_celsius)
-            if len(self.temperature_history) > 60:  # Keep last 60 readings
-                self.temperature_history.pop(0)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current statistics"""
+        frame_count, imu_data_count, error_count = self.frame_count, self.imu_data_count, self.error_count
+        dropped_count = self.dropped_count
+        
         with self.lock:
             uptime = time.time() - self.start_time
-            avg_fps = sum(self.fps_history) / len(self.fps_history) if self.fps_history else 0
-            avg_temp = sum(self.temperature_history) / len(self.temperature_history) if self.temperature_history else None
+            avg_fps = self._fps_sum / len(self.fps_history) if self.fps_history else 0
+            avg_temp = self._temp_sum / len(self.temperature_history) if self.temperature_history else None
             
             return {
                 "uptime_seconds": uptime,
                 "uptime_formatted": str(datetime.fromtimestamp(uptime) - datetime.fromtimestamp(0)),
-                "total_frames": self.frame_count,
-                "error_count": self.error_count,
+                "total_frames": frame_count,
+                "error_count": error_count,
+                "dropped_messages": dropped_count,
                 "current_fps": self.fps_history[-1] if self.fps_history else 0,
                 "average_fps": avg_fps,
-                "imu_data_count": self.imu_data_count,
+                "imu_data_count": imu_data_count,
                 "average_temperature_c": avg_temp,
                 "current_temperature_c": self.temperature_history[-1] if self.temperature_history else None,
                 "last_frame_time": datetime.fromtimestamp(self.last_frame_time).isoformat()
@@ -165,6 +257,9 @@ class DepthAIStats:
 class HealthMonitor:
     """Health monitoring and status reporting"""
     
+    # Longest an unchanged status may go without a rewrite, so its timestamp stays a heartbeat (seconds)
+    STATUS_MAX_AGE = 60
+    
     def __init__(self, stats: DepthAIStats, config: DepthAIConfig):
         self.stats = stats
         self.config = config
@@ -172,6 +267,9 @@ class HealthMonitor:
         self.lock = threading.Lock()
         self.running = True
         
+        # (total_frames, error_count, rounded fps, age bucket) of the last status written
+        self._last_status_key = None
+        
         # Create status directory
         os.makedirs(os.path.dirname(self.status_file), exist_ok=True)
     
@@ -197,6 +295,15 @@ class HealthMonitor:
         """Update status file"""
         try:
             stats = self.stats.get_stats()
+            
+            # Health depends only on these; with no new frames or errors the file would not change
+            # beyond its timestamp and uptime, so leave it alone until the age bucket rolls over
+            # (a stalled pipeline still refreshes the timestamp readers go by)
+            key = (stats["total_frames"], stats["error_count"], round(stats["current_fps"]),
+                   int(time.time() // self.STATUS_MAX_AGE))
+            if key == self._last_status_key:
+                return
+            
             status = {
                 "timestamp": datetime.now().isoformat(),
                 "status": "running",
@@ -205,8 +312,9 @@ class HealthMonitor:
                 "health": self._check_health(stats)
             }
             
-            with open(self.status_file, 'w') as f:
-                json.dump(status, f, indent=2)
+            # Status stays indented for people reading it; at one write per interval that is cheap
+            _write_file_atomic(self.status_file, _json_bytes(status, indent=True))
+            self._last_status_key = key
                 
         except Exception as e:
             logging.error(f"Error updating status: {e}")
@@ -230,9 +338,102 @@ class HealthMonitor:
         
         return health
 
+def _init_save_worker():
+    """Prepare a frame-saving worker: leave signal handling to the daemon, load OpenCV"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    
+    # OpenCV is only needed for encoding, so only the workers load it
+    import cv2  # noqa: F401
+
+# Worker-side state: attached shared memory by slot, the JET colormap LUT and
+# the TurboJPEG encoder (False once libturbojpeg turned out to be missing)
+_worker_segments: Dict[int, shared_memory.SharedMemory] = {}
+_jet_lut: Optional[np.ndarray] = None
+_turbo_jpeg = None
+
+def _attach_segment(slot: int, name: str) -> shared_memory.SharedMemory:
+    """Attach to a frame slot once per worker and keep it mapped until the slot is replaced"""
+    segment = _worker_segments.get(slot)
+    if segment is None or segment.name != name:
+        if segment is not None:
+            segment.close()
+        segment = shared_memory.SharedMemory(name=name)
+        _worker_segments[slot] = segment
+    return segment
+
+def _colorize_depth(depth_map: np.ndarray) -> np.ndarray:
+    """Normalize depth in one fused scale+offset pass, then colorize via a JET lookup table"""
+    import cv2
+    global _jet_lut
+    if _jet_lut is None:
+        _jet_lut = cv2.applyColorMap(
+            np.arange(256, dtype=np.uint8).reshape(-1, 1), cv2.COLORMAP_JET
+        ).reshape(256, 3)
+    
+    depth_min, depth_max = cv2.minMaxLoc(depth_map)[:2]
+    scale = 255.0 / (depth_max - depth_min) if depth_max > depth_min else 0.0
+    depth_u8 = cv2.convertScaleAbs(depth_map, alpha=scale, beta=-depth_min * scale)
+    return np.take(_jet_lut, depth_u8, axis=0)
+
+def _encode_jpeg(frame: np.ndarray, rgb: bool = False):
+    """Encode a BGR (or RGB) frame as JPEG with libjpeg-turbo when available, else OpenCV"""
+    import cv2
+    global _turbo_jpeg
+    if _turbo_jpeg is None:
+        _turbo_jpeg = False
+        if TURBOJPEG_AVAILABLE:
+            try:
+                _turbo_jpeg = TurboJPEG()
+            except Exception as e:
+                logging.debug(f"TurboJPEG unavailable, encoding with OpenCV: {e}")
+    
+    if _turbo_jpeg:
+        # TurboJPEG reads RGB directly, no channel swap needed
+        return _turbo_jpeg.encode(frame, quality=JPEG_QUALITY,
+                                  pixel_format=TJPF_RGB if rgb else TJPF_BGR,
+                                  jpeg_subsample=TJSAMP_420)
+    
+    if rgb:
+        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+    ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+    if not ok:
+        raise IOError("Could not encode frame")
+    return encoded
+
+def _encode_and_write(slot: int, segment_name: str, shape: tuple, dtype: str, filepath: str,
+                      convert: Optional[str] = None):
+    """Encode a frame from a shared memory slot to disk (runs in a worker process)
+
+    convert is "depth" to colorize a raw depth map or "rgb" for frames in RGB order.
+    """
+    frame = np.ndarray(shape, dtype=np.dtype(dtype), buffer=_attach_segment(slot, segment_name).buf)
+    if convert == "depth":
+        frame = _colorize_depth(frame)
+    
+    encoded = _encode_jpeg(frame, rgb=convert == "rgb")
+    
+    # Hand the whole JPEG to the kernel in one write instead of libjpeg's stdio chunks
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(encoded).cast("B")
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 class DepthAIDaemon:
     """Main DepthAI daemon service"""
     
+    # Frames waiting for a save worker before new ones are dropped
+    MAX_PENDING_SAVES = 8
+    # Device messages waiting for the processing thread before new ones are dropped
+    # (room for every device output queue: 4 rgb + 4 depth + 4 detections + 50 imu)
+    MAX_PENDING_MESSAGES = 64
+    # Write buffer of the IMU log and how often it is flushed to disk (seconds)
+    IMU_BUFFER_SIZE = 1 << 20
+    IMU_FLUSH_INTERVAL = 1.0
+    
     def __init__(self, config_path: str = "/etc/depthai-daemon/config.json"):
         self.config = DepthAIConfig(config_path)
         self.stats = DepthAIStats()
@@ -240,8 +441,27 @@ class DepthAIDaemon:
         
         self.device = None
         self.pipeline = None
+        self._pipeline_hash = None
         self.running = True
         self.device_info = {}
+        
+        # IMU reports enabled in the current pipeline, set by _create_pipeline
+        self._imu_has_acc = self._imu_has_gyro = self._imu_has_mag = self._imu_has_rot = False
+        
+        # Per-stream (queue, handler) pairs and the fan-in queue, set up per connection in run()
+        self._dispatch = []
+        self._in_q = queue.Queue(maxsize=self.MAX_PENDING_MESSAGES)
+        self._frame_count = 0
+        
+        # Second-resolution timestamp prefix reused by _fmt_ts until the second changes
+        self._ts_sec = 0
+        self._ts_prefix = ""
+        
+        # IMU samples are appended as NDJSON to one buffered log per hour (imu_YYYYmmdd_HH.jsonl)
+        self._imu_file = None
+        self._imu_file_key = None
+        self._imu_lock = threading.Lock()
+        
         self.available_features = {
             "imu": False,
             "depth": True,
@@ -257,9 +477,63 @@ class DepthAIDaemon:
         # Setup logging
         self._setup_logging()
         
-        # Create output directory if needed
-        if self.config.config["output"]["save_frames"]:
-            os.makedirs(self.config.config["output"]["output_directory"], exist_ok=True)
+        # Snapshot hot-path settings and create output directory if needed
+        self._refresh_runtime_cfg()
+        
+        # Depth colorizing and JPEG encoding run in worker processes so they neither hold
+        # the GIL nor block the capture loop; forkserver keeps workers clean of the device threads.
+        # SIGHUP is ignored while the pool starts so the forkserver and resource tracker inherit
+        # the ignore: a reload signalled to the whole cgroup must not kill them.
+        reload_handler = signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        try:
+            self.save_pool = multiprocessing.get_context("forkserver").Pool(
+                processes=max(1, (os.cpu_count() or 2) // 2),
+                initializer=_init_save_worker
+            )
+        finally:
+            signal.signal(signal.SIGHUP, reload_handler)
+        
+        # Frames reach the workers through a ring of shared memory slots sized up front for the
+        # largest configured frame (RGB preview or 16-bit depth); only the slot name crosses the pipe
+        camera = self.config.config["camera"]
+        preview_w, preview_h = camera["preview_size"]
+        mono_w, mono_h = camera["mono_resolution"]
+        slot_size = max(preview_w * preview_h * 3, mono_w * mono_h * 2)
+        self._save_segments = [
+            shared_memory.SharedMemory(create=True, size=slot_size)
+            for _ in range(self.MAX_PENDING_SAVES)
+        ]
+        self._free_slots = queue.SimpleQueue()
+        for slot in range(self.MAX_PENDING_SAVES):
+            self._free_slots.put(slot)
+        
+        # Saved frame paths, oldest first, so frames past max_files are removed without
+        # rescanning the directory; seeded once from what earlier runs left behind
+        self._saved_frames = deque()
+        if self._save_frames:
+            self._seed_saved_frames()
+    
+    def _seed_saved_frames(self):
+        """Queue the frames earlier runs left in the output directory, oldest first"""
+        found = []
+        try:
+            with os.scandir(self._out_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".jpg"):
+                        continue
+                    try:
+                        found.append((entry.stat().st_ctime, entry.path))
+                    except FileNotFoundError:
+                        # Removed between listing and stat
+                        continue
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logging.error(f"Error scanning saved frames: {e}")
+            return
+        
+        found.sort()
+        self._saved_frames.extend(path for _, path in found)
     
     def _setup_logging(self):
         """Setup logging configuration"""
@@ -268,28 +542,28 @@ class DepthAIDaemon:
         # Create logs directory
         os.makedirs("/var/log/depthai-daemon", exist_ok=True)
         
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('/var/log/depthai-daemon/daemon.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
-        
         # Rotate log files
-        from logging.handlers import RotatingFileHandler
+        from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
         file_handler = RotatingFileHandler(
             '/var/log/depthai-daemon/daemon.log',
             maxBytes=10*1024*1024,  # 10MB
             backupCount=5
         )
-        file_handler.setFormatter(
-            logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        )
+        stream_handler = logging.StreamHandler(sys.stdout)
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler.setFormatter(formatter)
+        stream_handler.setFormatter(formatter)
+        
+        # Callers only enqueue records; a listener thread does the file and console writes
+        self._log_queue = queue.SimpleQueue()
+        self._log_listener = QueueListener(self._log_queue, file_handler, stream_handler)
+        self._log_listener.start()
+        # Stop (and so drain) the listener at interpreter exit, including error exits
+        atexit.register(self._log_listener.stop)
         
         logger = logging.getLogger()
-        logger.handlers = [file_handler, logging.StreamHandler(sys.stdout)]
+        logger.setLevel(log_level)
+        logger.handlers = [QueueHandler(self._log_queue)]
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
@@ -347,8 +621,29 @@ class DepthAIDaemon:
         """Reload configuration on SIGHUP"""
         logging.info("Reloading configuration...")
         self.config = DepthAIConfig(self.config.config_path)
+        self.health_monitor.config = self.config
+        self._refresh_runtime_cfg()
         logging.info("Configuration reloaded")
     
+    def _refresh_runtime_cfg(self):
+        """Copy the settings read per frame into plain attributes"""
+        output = self.config.config["output"]
+        self._save_frames = bool(output["save_frames"])
+        self._out_dir = output["output_directory"]
+        self._max_files = output["max_files"]
+        
+        if self._save_frames:
+            os.makedirs(self._out_dir, exist_ok=True)
+    
+    def _pipeline_config_hash(self) -> str:
+        """Hash of the configuration and device features _create_pipeline depends on"""
+        relevant = {
+            "camera": self.config.config["camera"],
+            "ai": self.config.config["ai"],
+            "imu_available": self.available_features.get("imu", False)
+        }
+        return hashlib.blake2b(_json_bytes(relevant), digest_size=16).hexdigest()
+    
     def _create_pipeline(self) -> dai.Pipeline:
         """Create DepthAI pipeline based on configuration"""
         pipeline = dai.Pipeline()
@@ -359,6 +654,7 @@ class DepthAIDaemon:
         cam_rgb.setResolution(dai.ColorCameraProperties.SensorResolution.THE_1080_P)
         cam_rgb.setVideoSize(*self.config.config["camera"]["rgb_resolution"])
         cam_rgb.setColorOrder(dai.ColorCameraProperties.ColorOrder.RGB)
+        cam_rgb.setInterleaved(True)  # HxWx3 preview, viewed in place on the host
         cam_rgb.setFps(self.config.config["camera"]["rgb_fps"])
         
         # RGB Output
@@ -425,9 +721,16 @@ class DepthAIDaemon:
                 # Add magnetometer if available (9-axis IMU)
                 try:
                     imu_sensors.append(dai.IMUSensor.MAGNETOMETER_RAW)
+                    self._imu_has_mag = True
                 except:
+                    self._imu_has_mag = False
                     logging.info("Magnetometer not available (6-axis IMU)")
                 
+                # Remember which reports packets carry so handlers need not probe them
+                self._imu_has_acc = dai.IMUSensor.ACCELEROMETER_RAW in imu_sensors
+                self._imu_has_gyro = dai.IMUSensor.GYROSCOPE_RAW in imu_sensors
+                self._imu_has_rot = dai.IMUSensor.ROTATION_VECTOR in imu_sensors
+                
                 # Configure IMU frequency
                 imu_freq = self.config.config["camera"]["imu_frequency"]
                 imu.enableIMUSensor(imu_sensors, imu_freq)
@@ -446,155 +749,238 @@ class DepthAIDaemon:
         
         return pipeline
     
-    def _process_frames(self, queues: Dict[str, dai.DataOutputQueue]):
+    def _on_queue_message(self, handler, name: str, msg):
+        """Device queue callback: hand the message and its handler to the processing thread"""
+        # Bounded like the device queues: drop rather than hold messages without limit
+        try:
+            self._in_q.put_nowait((handler, msg))
+        except queue.Full:
+            self.stats.increment_dropped()
+    
+    def _process_frames(self):
         """Process incoming frames"""
-        frame_count = 0
+        self._frame_count = 0
+        in_q = self._in_q
         
         while self.running:
+            # Block until a queue callback delivers a message instead of polling every queue
             try:
-                # Get RGB frame
-                if "rgb" in queues:
-                    rgb_frame = queues["rgb"].tryGet()
-                    if rgb_frame is not None:
-                        frame = rgb_frame.getCvFrame()
-                        self._handle_rgb_frame(frame, frame_count)
-                
-                # Get depth frame
-                if "depth" in queues:
-                    depth_frame = queues["depth"].tryGet()
-                    if depth_frame is not None:
-                        depth_map = depth_frame.getFrame()
-                        self._handle_depth_frame(depth_map, frame_count)
-                
-                # Get detections
-                if "detections" in queues:
-                    detections = queues["detections"].tryGet()
-                    if detections is not None:
-                        self._handle_detections(detections.detections)
-                
-                # Get IMU data
-                if "imu" in queues:
-                    imu_data = queues["imu"].tryGet()
-                    if imu_data is not None:
-                        self._handle_imu_data(imu_data.packets)
-                
-                self.stats.update_frame_stats()
-                frame_count += 1
-                
-                # Small delay to prevent CPU spinning
-                time.sleep(0.001)
-                
+                handler, msg = in_q.get(timeout=0.5)
+            except queue.Empty:
+                if any(stream.isClosed() for stream, _ in self._dispatch):
+                    raise RuntimeError("Device output queues closed")
+                continue
+            
+            try:
+                handler(msg)
             except Exception as e:
                 logging.error(f"Error processing frames: {e}")
                 self.stats.increment_error()
     
+    def _on_rgb_message(self, msg):
+        """Handle an RGB preview message and count the frame"""
+        # A numpy view over the message data; the only copy is into a save slot
+        frame = msg.getData().reshape(msg.getHeight(), msg.getWidth(), 3)
+        self._handle_rgb_frame(frame, self._frame_count)
+        self.stats.update_frame_stats()
+        self._frame_count += 1
+    
     def _handle_rgb_frame(self, frame: np.ndarray, frame_count: int):
-        """Handle RGB frame processing"""
-        if self.config.config["output"]["save_frames"]:
-            self._save_frame(frame, "rgb", frame_count)
+        """Handle RGB frame processing (frame is in RGB order)"""
+        if self._save_frames:
+            # The save worker reorders to BGR for encoding
+            self._save_frame(frame, "rgb", frame_count, convert="rgb")
     
     def _handle_depth_frame(self, depth_map: np.ndarray, frame_count: int):
         """Handle depth frame processing"""
-        if self.config.config["output"]["save_frames"]:
-            # Normalize depth for saving
-            depth_normalized = cv2.normalize(depth_map, None, 0, 255, cv2.NORM_MINMAX, cv2.CV_8U)
-            depth_colored = cv2.applyColorMap(depth_normalized, cv2.COLORMAP_JET)
-            self._save_frame(depth_colored, "depth", frame_count)
+        if self._save_frames:
+            # The save worker normalizes and colorizes the raw depth map
+            self._save_frame(depth_map, "depth", frame_count, convert="depth")
     
     def _handle_detections(self, detections):
         """Handle AI detection results"""
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return
+        
         for detection in detections:
             logging.debug(f"Detection: {detection.label} ({detection.confidence:.2f})")
     
     def _handle_imu_data(self, imu_packets):
         """Handle IMU data packets"""
+        log_debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        
         for packet in imu_packets:
             self.stats.update_imu_stats()
             
             # Log IMU data based on sensor type
-            sensor_type = packet.acceleroMeter if hasattr(packet, 'acceleroMeter') else None
-            if sensor_type:
-                acc_data = sensor_type
+            if log_debug and self._imu_has_acc:
+                acc_data = packet.acceleroMeter
                 logging.debug(f"Accelerometer: x={acc_data.x:.3f}, y={acc_data.y:.3f}, z={acc_data.z:.3f}")
             
-            gyro_data = packet.gyroscope if hasattr(packet, 'gyroscope') else None
-            if gyro_data:
+            if log_debug and self._imu_has_gyro:
+                gyro_data = packet.gyroscope
                 logging.debug(f"Gyroscope: x={gyro_data.x:.3f}, y={gyro_data.y:.3f}, z={gyro_data.z:.3f}")
             
             # Save IMU data if configured
-            if self.config.config["output"]["save_frames"]:
+            if self._save_frames:
                 self._save_imu_data(packet)
     
-    def _save_frame(self, frame: np.ndarray, frame_type: str, frame_count: int):
+    def _save_frame(self, frame: np.ndarray, frame_type: str, frame_count: int,
+                    convert: Optional[str] = None):
         """Save frame to disk"""
         try:
-            output_dir = self.config.config["output"]["output_directory"]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_dir = self._out_dir
+            timestamp = self._fmt_ts()
             filename = f"{frame_type}_{timestamp}_{frame_count:06d}.jpg"
             filepath = os.path.join(output_dir, filename)
             
-            cv2.imwrite(filepath, frame)
+            # Drop the frame rather than queueing unbounded memory when workers fall behind
+            try:
+                slot = self._free_slots.get_nowait()
+            except queue.Empty:
+                self.stats.increment_dropped()
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(f"Save queue full, dropping {frame_type} frame {frame_count}")
+                return
             
-            # Clean up old files if necessary
-            self._cleanup_old_files(output_dir)
+            try:
+                segment = self._frame_segment(slot, frame.nbytes)
+                np.ndarray(frame.shape, dtype=frame.dtype, buffer=segment.buf)[...] = frame
+                self.save_pool.apply_async(
+                    _encode_and_write,
+                    (slot, segment.name, frame.shape, frame.dtype.str, filepath, convert),
+                    callback=partial(self._on_frame_saved, slot, filepath),
+                    error_callback=partial(self._on_frame_save_error, slot)
+                )
+            except Exception:
+                self._free_slots.put(slot)
+                raise
             
         except Exception as e:
             logging.error(f"Error saving frame: {e}")
     
-    def _cleanup_old_files(self, directory: str):
-        """Remove old files if we exceed max_files limit"""
-        try:
-            max_files = self.config.config["output"]["max_files"]
-            files = sorted(Path(directory).glob("*.jpg"), key=os.path.getctime)
-            
-            if len(files) > max_files:
-                files_to_remove = files[:-max_files]
-                for file in files_to_remove:
-                    file.unlink()
-                    
-        except Exception as e:
-            logging.error(f"Error cleaning up files: {e}")
+    def _fmt_ts(self, micros: bool = False) -> str:
+        """Local time as YYYYmmdd_HHMMSS (plus _ffffff), formatting the seconds once per second"""
+        now = time.time()
+        sec = int(now)
+        if sec != self._ts_sec:
+            self._ts_prefix = time.strftime("%Y%m%d_%H%M%S", time.localtime(sec))
+            self._ts_sec = sec
+        
+        if micros:
+            return f"{self._ts_prefix}_{int((now - sec) * 1e6):06d}"
+        return self._ts_prefix
+    
+    def _frame_segment(self, slot: int, size: int) -> shared_memory.SharedMemory:
+        """Get the shared memory of a free slot, replacing it if the frame does not fit"""
+        segment = self._save_segments[slot]
+        if segment.size < size:
+            # Workers see the new name on their next frame from this slot and drop the old mapping
+            segment.close()
+            segment.unlink()
+            segment = shared_memory.SharedMemory(create=True, size=size)
+            self._save_segments[slot] = segment
+        return segment
+    
+    def _on_frame_saved(self, slot: int, filepath: str, result):
+        """Release the save slot once a worker has written the frame and drop the oldest frames"""
+        self._free_slots.put(slot)
+        
+        # Runs on the pool's result thread only, so the deque needs no lock
+        self._saved_frames.append(filepath)
+        while len(self._saved_frames) > self._max_files:
+            try:
+                os.unlink(self._saved_frames.popleft())
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logging.error(f"Error cleaning up files: {e}")
+    
+    def _on_frame_save_error(self, slot: int, error: BaseException):
+        """Release the save slot and record a failed frame write"""
+        self._free_slots.put(slot)
+        logging.error(f"Error saving frame: {error}")
+        self.stats.increment_error()
     
     # Corrected method: Added proper exception handling
     def _save_imu_data(self, imu_packet):
-        """Save IMU data to file"""
+        """Append IMU sample to the hourly IMU log"""
         try:
-            output_dir = self.config.config["output"]["output_directory"]
-            imu_dir = os.path.join(output_dir, "imu")
-            os.makedirs(imu_dir, exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-            filename = f"imu_{timestamp}.json"
-            filepath = os.path.join(imu_dir, filename)
+            timestamp = self._fmt_ts(micros=True)
             
             # Extract IMU data into a dictionary
             imu_data = {
                 "timestamp": timestamp,
-                "sequence_num": imu_packet.sequenceNum if hasattr(imu_packet, 'sequenceNum') else 0
+                "sequence_num": getattr(imu_packet, 'sequenceNum', 0)
             }
             
-            # Add sensor data if available
-            if hasattr(imu_packet, 'acceleroMeter'):
+            # Add data of the sensors enabled in the pipeline
+            if self._imu_has_acc:
                 acc = imu_packet.acceleroMeter
                 imu_data["accelerometer"] = {"x": acc.x, "y": acc.y, "z": acc.z}
             
-            if hasattr(imu_packet, 'gyroscope'):
+            if self._imu_has_gyro:
                 gyro = imu_packet.gyroscope
                 imu_data["gyroscope"] = {"x": gyro.x, "y": gyro.y, "z": gyro.z}
             
-            if hasattr(imu_packet, 'magneticField'):
+            if self._imu_has_mag:
                 mag = imu_packet.magneticField
                 imu_data["magnetometer"] = {"x": mag.x, "y": mag.y, "z": mag.z}
             
-            if hasattr(imu_packet, 'rotationVector'):
+            if self._imu_has_rot:
                 rot = imu_packet.rotationVector
                 imu_data["rotation"] = {"i": rot.i, "j": rot.j, "k": rot.k, "real": rot.real}
             
-            with open(filepath, 'w') as f:
-                json.dump(imu_data, f, indent=2)
+            line = _json_line(imu_data)
+            
+            with self._imu_lock:
+                # Rotate on the hour, or when a reload changed the output directory
+                key = (self._out_dir, timestamp[:11])
+                if key != self._imu_file_key:
+                    self._open_imu_file(key)
+                self._imu_file.write(line)
                 
         except Exception as e:
             logging.error(f"Error saving IMU data: {e}")
+    
+    def _open_imu_file(self, key):
+        """Switch to the IMU log for (output directory, YYYYmmdd_HH); call with _imu_lock held"""
+        self._close_imu_file()
+        
+        output_dir, hour = key
+        imu_dir = os.path.join(output_dir, "imu")
+        os.makedirs(imu_dir, exist_ok=True)
+        
+        self._imu_file = open(os.path.join(imu_dir, f"imu_{hour}.jsonl"), "ab",
+                              buffering=self.IMU_BUFFER_SIZE)
+        self._imu_file_key = key
+    
+    def _close_imu_file(self):
+        """Flush and close the current IMU log; call with _imu_lock held"""
+        if self._imu_file is not None:
+            self._imu_file.close()
+            self._imu_file = None
+            self._imu_file_key = None
+    
+    def _imu_flush_loop(self):
+        """Push buffered IMU samples to disk once per interval"""
+        while self.running:
+            time.sleep(self.IMU_FLUSH_INTERVAL)
+            try:
+                with self._imu_lock:
+                    if self._imu_file is None:
+                        continue
+                    self._imu_file.flush()
+                    # A duplicate fd stays valid even if the log rotates while syncing
+                    fd = os.dup(self._imu_file.fileno())
+                
+                # Sync outside the lock so a slow disk never stalls the processing thread
+                try:
+                    os.fdatasync(fd)
+                finally:
+                    os.close(fd)
+            except Exception as e:
+                logging.error(f"Error flushing IMU data: {e}")
 
     def run(self):
         """Main daemon loop"""
@@ -602,6 +988,7 @@ class DepthAIDaemon:
         
         # Start health monitoring
         self.health_monitor.start_monitoring()
+        threading.Thread(target=self._imu_flush_loop, daemon=True).start()
         
         reconnect_attempts = 0
         max_attempts = self.config.config["service"]["max_reconnect_attempts"]
@@ -609,8 +996,14 @@ class DepthAIDaemon:
         
         while self.running and reconnect_attempts < max_attempts:
             try:
-                logging.info("Creating pipeline...")
-                self.pipeline = self._create_pipeline()
+                # Rebuild the pipeline only when the settings it is built from changed
+                pipeline_hash = self._pipeline_config_hash()
+                if self.pipeline is None or pipeline_hash != self._pipeline_hash:
+                    logging.info("Creating pipeline...")
+                    self.pipeline = self._create_pipeline()
+                    self._pipeline_hash = pipeline_hash
+                else:
+                    logging.info("Reusing pipeline...")
                 
                 logging.info("Connecting to device...")
                 with dai.Device(self.pipeline) as device:
@@ -644,11 +1037,24 @@ class DepthAIDaemon:
                         self.available_features.get("imu", False)):
                         queues["imu"] = device.getOutputQueue("imu", maxSize=50, blocking=False)
                     
+                    # Resolve each stream's handler once; callbacks enqueue it with the message
+                    # into the single queue the processing loop blocks on
+                    handlers = {
+                        "rgb": self._on_rgb_message,
+                        "depth": lambda msg: self._handle_depth_frame(msg.getFrame(), self._frame_count),
+                        "detections": lambda msg: self._handle_detections(msg.detections),
+                        "imu": lambda msg: self._handle_imu_data(msg.packets),
+                    }
+                    self._dispatch = [(stream, handlers[name]) for name, stream in queues.items()]
+                    self._in_q = queue.Queue(maxsize=self.MAX_PENDING_MESSAGES)
+                    for stream, handler in self._dispatch:
+                        stream.addCallback(partial(self._on_queue_message, handler))
+                    
                     logging.info("Starting frame processing...")
                     reconnect_attempts = 0  # Reset on successful connection
                     
                     # Main processing loop
-                    self._process_frames(queues)
+                    self._process_frames()
                     
             except Exception as e:
                 reconnect_attempts += 1
@@ -663,6 +1069,17 @@ class DepthAIDaemon:
                     break
         
         self.health_monitor.stop_monitoring()
+        
+        with self._imu_lock:
+            self._close_imu_file()
+        
+        # Let pending frame writes finish
+        self.save_pool.close()
+        self.save_pool.join()
+        for segment in self._save_segments:
+            segment.close()
+            segment.unlink()
+        
         logging.info("DepthAI Daemon stopped")
 
 def main():
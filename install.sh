@@ -81,6 +81,7 @@ install_system_dependencies() {
         libusb-1.0-0-dev \
         libopencv-dev \
         python3-opencv \
+        libturbojpeg0 \
         udev \
         nano
     log_success "System dependencies installed"
@@ -118,7 +119,7 @@ setup_virtual_environment() {
         source venv/bin/activate
         pip install -U pip setuptools wheel
         pip install --extra-index-url https://artifacts.luxonis.com/artifactory/luxonis-python-snapshot-local/ depthai
-        pip install opencv-python numpy
+        pip install opencv-python numpy orjson PyTurboJPEG
     "
 
     log_success "Virtual environment setup complete"